@@ -4,6 +4,7 @@ import (
 	"context"
 	"fmt"
 	"math/rand"
+	"net/http"
 	"time"
 
 	"github.com/sstent/fitness-tui/internal/circuitbreaker"
@@ -28,8 +29,18 @@ func NewOpenRouterClient(cfg *config.Config) *OpenRouterClient {
 	}
 
 	cb := circuitbreaker.New(5, 30*time.Second)
+
+	// Keep more idle connections to the API host alive between calls so
+	// retries and follow-up analyses reuse a TCP+TLS session instead of
+	// paying a fresh handshake. Clone the default transport rather than
+	// building one from scratch, which would drop proxy support and the
+	// dial/TLS timeouts along with the rest of its defaults.
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConnsPerHost = 10
+
 	return &OpenRouterClient{
 		client: resty.New().
+			SetTransport(transport).
 			SetBaseURL(cfg.OpenRouter.BaseURL).
 			SetTimeout(timeout).
 			SetHeader("Content-Type", "application/json").
@@ -0,0 +1,62 @@
+package analysis
+
+import (
+	"context"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+	"time"
+
+	"github.com/sstent/fitness-tui/internal/config"
+	"github.com/sstent/fitness-tui/internal/tui/models"
+	"github.com/stretchr/testify/assert"
+)
+
+func newTestClient(baseURL string) *OpenRouterClient {
+	cfg := &config.Config{}
+	cfg.OpenRouter.BaseURL = baseURL
+	cfg.OpenRouter.Model = "test-model"
+	cfg.OpenRouter.APIKey = "test-key"
+	cfg.OpenRouter.Timeout = 5 * time.Second
+	return NewOpenRouterClient(cfg)
+}
+
+func testPromptParams() PromptParams {
+	return PromptParams{
+		Activity: &models.Activity{
+			Name: "Morning Ride",
+			Type: "cycling",
+			Date: time.Date(2024, 6, 1, 8, 0, 0, 0, time.UTC),
+		},
+	}
+}
+
+func TestAnalyzeActivity(t *testing.T) {
+	t.Run("successful response", func(t *testing.T) {
+		server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+			assert.Equal(t, "/chat/completions", r.URL.Path)
+			assert.Equal(t, "Bearer test-key", r.Header.Get("Authorization"))
+			w.Header().Set("Content-Type", "application/json")
+			w.Write([]byte(`{"choices":[{"message":{"content":"## Summary\nSolid ride."}}]}`))
+		}))
+		defer server.Close()
+
+		client := newTestClient(server.URL)
+		result, err := client.AnalyzeActivity(context.Background(), testPromptParams())
+		assert.NoError(t, err)
+		assert.Contains(t, result, "Solid ride")
+	})
+
+	t.Run("empty choices", func(t *testing.T) {
+		server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+			w.Header().Set("Content-Type", "application/json")
+			w.Write([]byte(`{"choices":[]}`))
+		}))
+		defer server.Close()
+
+		client := newTestClient(server.URL)
+		_, err := client.AnalyzeActivity(context.Background(), testPromptParams())
+		assert.Error(t, err)
+		assert.Contains(t, err.Error(), "empty analysis content")
+	})
+}
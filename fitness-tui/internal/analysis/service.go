@@ -29,8 +29,10 @@ func NewAnalysisService(client *OpenRouterClient, storage *storage.AnalysisCache
 
 // GetAnalysis retrieves cached analysis or generates new analysis if needed
 func (s *AnalysisService) GetAnalysis(ctx context.Context, activity *models.Activity, workoutGoal string) (string, error) {
-	// Check cache first
-	if content, _, err := s.storage.GetAnalysis(activity.ID); err == nil {
+	// Check cache first; a hit is only valid while the activity content
+	// it was generated from is unchanged
+	contentHash := storage.ContentHash(activity)
+	if content, meta, err := s.storage.GetAnalysis(activity.ID); err == nil && (meta.Hash == "" || meta.Hash == contentHash) {
 		return content, nil
 	}
 
@@ -61,6 +63,7 @@ func (s *AnalysisService) GetAnalysis(ctx context.Context, activity *models.Acti
 		ActivityID:  activity.ID,
 		GeneratedAt: time.Now(),
 		ModelUsed:   s.client.config.OpenRouter.Model,
+		Hash:        contentHash,
 	}
 	if err := s.storage.StoreAnalysis(activity, analysis, meta); err != nil {
 		return "", fmt.Errorf("failed to cache analysis: %w", err)
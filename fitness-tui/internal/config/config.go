@@ -98,10 +98,6 @@ func setViperDefaults() {
 	viper.SetDefault("openrouter.model", "deepseek/deepseek-r1-0528")
 	viper.SetDefault("openrouter.base_url", "https://openrouter.ai/api/v1")
 	viper.SetDefault("openrouter.timeout", 30*time.Second)
-	viper.SetDefault("openrouter.base_url", "https://openrouter.ai/api/v1")
-	viper.SetDefault("openrouter.timeout", "30s")
-	viper.SetDefault("openrouter.base_url", "https://openrouter.ai/api/v1")
-	viper.SetDefault("openrouter.timeout", 30*time.Second)
 
 	// Metrics defaults
 	viper.SetDefault("metrics.cycling.power", true)
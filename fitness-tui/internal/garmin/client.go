@@ -3,6 +3,7 @@ package garmin
 import (
 	"context"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
 	"time"
@@ -50,6 +51,15 @@ func (c *Client) Connect(logger Logger) error {
 	if logger == nil {
 		logger = &NoopLogger{}
 	}
+
+	// Reuse an established session; Sync and the fetch paths call Connect
+	// defensively, and repeating the session-load/login handshake costs a
+	// round trip each time. c.garthClient is only set once authentication
+	// succeeded, so a non-nil client always means a usable session.
+	if c.garthClient != nil {
+		return nil
+	}
+
 	logger.Infof("Starting Garmin authentication")
 
 	// Create client with default domain
@@ -58,28 +68,29 @@ func (c *Client) Connect(logger Logger) error {
 		logger.Errorf("Failed to create Garmin client: %v", err)
 		return err
 	}
-	c.garthClient = garthClient
 
 	// Check for existing session
 	sessionFile := filepath.Join(c.storagePath, "garmin_session.json")
 	if _, err := os.Stat(sessionFile); err == nil {
-		if err := c.garthClient.LoadSession(sessionFile); err == nil {
+		if err := garthClient.LoadSession(sessionFile); err == nil {
 			logger.Infof("Loaded existing Garmin session")
+			c.garthClient = garthClient
 			return nil
 		}
 	}
 
 	// Perform login
-	if err := c.garthClient.Login(c.username, c.password); err != nil {
+	if err := garthClient.Login(c.username, c.password); err != nil {
 		logger.Errorf("Garmin authentication failed: %v", err)
 		return &AuthenticationError{Err: err}
 	}
 
 	// Save session for future use
-	if err := c.garthClient.SaveSession(sessionFile); err != nil {
+	if err := garthClient.SaveSession(sessionFile); err != nil {
 		logger.Warnf("Failed to save Garmin session: %v", err)
 	}
 
+	c.garthClient = garthClient
 	logger.Infof("Authentication successful")
 	return nil
 }
@@ -104,52 +115,23 @@ func (c *Client) GetActivities(ctx context.Context, limit int, logger Logger) ([
 		logger.Errorf("Failed to fetch activities (circuit breaker): %v", err)
 		return nil, err
 	}
-	garthActivities := resp.([]*garth.Activity)
+	// The garth client returns activities by value; convert rows in place
+	// rather than boxing a pointer per row
+	garthActivities := resp.([]garth.Activity)
 
 	// Convert to our internal model
 	activities := make([]*models.Activity, 0, len(garthActivities))
-	for _, ga := range garthActivities {
+	for i := range garthActivities {
+		ga := &garthActivities[i]
+
 		// Use the already parsed time from CustomTime struct
 		if ga.StartTimeGMT.IsZero() {
 			logger.Warnf("Activity %d has invalid start time", ga.ActivityID)
 			continue
 		}
 
-		// Convert garth activity to internal model
-		activity := &models.Activity{
-			ID:        fmt.Sprintf("%d", ga.ActivityID),
-			Name:      ga.ActivityName,
-			Type:      ga.ActivityType.TypeKey,
-			Date:      ga.StartTimeGMT.Time, // Access the parsed time directly
-			Distance:  ga.Distance,
-			Duration:  time.Duration(ga.Duration) * time.Second,
-			Elevation: ga.ElevationGain,
-			Calories:  int(ga.Calories),
-		}
-
-		// Populate metrics from garth data
-		if ga.AverageHR > 0 {
-			activity.Metrics.AvgHeartRate = int(ga.AverageHR)
-		}
-		if ga.MaxHR > 0 {
-			activity.Metrics.MaxHeartRate = int(ga.MaxHR)
-		}
-		if ga.AverageSpeed > 0 {
-			// Convert m/s to km/h
-			activity.Metrics.AvgSpeed = ga.AverageSpeed * 3.6
-		}
-		if ga.ElevationGain > 0 {
-			activity.Metrics.ElevationGain = ga.ElevationGain
-		}
-		if ga.ElevationLoss > 0 {
-			activity.Metrics.ElevationLoss = ga.ElevationLoss
-		}
-		if ga.AverageSpeed > 0 && ga.Distance > 0 {
-			// Calculate pace: seconds per km
-			activity.Metrics.AvgPace = (ga.Duration / ga.Distance) * 1000
-		}
-
-		activities = append(activities, activity)
+		activity := convertGarthActivity(ga)
+		activities = append(activities, &activity)
 	}
 
 	logger.Infof("Successfully fetched %d activities", len(activities))
@@ -191,7 +173,7 @@ func (c *Client) GetAllActivities(ctx context.Context, logger Logger) ([]models.
 			}
 			return nil, err
 		}
-		garthActivities := resp.([]*garth.Activity)
+		garthActivities := resp.([]garth.Activity)
 
 		if len(garthActivities) == 0 {
 			break
@@ -199,45 +181,16 @@ func (c *Client) GetAllActivities(ctx context.Context, logger Logger) ([]models.
 
 		logger.Infof("Fetched %d activities from offset %d", len(garthActivities), start)
 
-		for _, ga := range garthActivities {
+		for i := range garthActivities {
+			ga := &garthActivities[i]
+
 			// Skip activities with invalid start time
 			if ga.StartTimeGMT.IsZero() {
 				logger.Warnf("Activity %d has invalid start time", ga.ActivityID)
 				continue
 			}
 
-			activity := models.Activity{
-				ID:        fmt.Sprintf("%d", ga.ActivityID),
-				Name:      ga.ActivityName,
-				Type:      ga.ActivityType.TypeKey,
-				Date:      ga.StartTimeGMT.Time,
-				Distance:  ga.Distance,
-				Duration:  time.Duration(ga.Duration) * time.Second,
-				Elevation: ga.ElevationGain,
-				Calories:  int(ga.Calories),
-			}
-
-			// Populate metrics
-			if ga.AverageHR > 0 {
-				activity.Metrics.AvgHeartRate = int(ga.AverageHR)
-			}
-			if ga.MaxHR > 0 {
-				activity.Metrics.MaxHeartRate = int(ga.MaxHR)
-			}
-			if ga.AverageSpeed > 0 {
-				activity.Metrics.AvgSpeed = ga.AverageSpeed * 3.6
-			}
-			if ga.ElevationGain > 0 {
-				activity.Metrics.ElevationGain = ga.ElevationGain
-			}
-			if ga.ElevationLoss > 0 {
-				activity.Metrics.ElevationLoss = ga.ElevationLoss
-			}
-			if ga.AverageSpeed > 0 && ga.Distance > 0 {
-				activity.Metrics.AvgPace = (ga.Duration / ga.Distance) * 1000
-			}
-
-			allActivities = append(allActivities, activity)
+			allActivities = append(allActivities, convertGarthActivity(ga))
 		}
 
 		// Break if we got fewer than page size
@@ -255,6 +208,46 @@ func (c *Client) GetAllActivities(ctx context.Context, logger Logger) ([]models.
 	return allActivities, nil
 }
 
+// convertGarthActivity maps a garth API activity onto the internal model.
+// Both fetch paths share this single conversion so field mappings can't
+// drift between them.
+func convertGarthActivity(ga *garth.Activity) models.Activity {
+	activity := models.Activity{
+		ID:        fmt.Sprintf("%d", ga.ActivityID),
+		Name:      ga.ActivityName,
+		Type:      ga.ActivityType.TypeKey,
+		Date:      ga.StartTimeGMT.Time, // Access the parsed time directly
+		Distance:  ga.Distance,
+		Duration:  time.Duration(ga.Duration) * time.Second,
+		Elevation: ga.ElevationGain,
+		Calories:  int(ga.Calories),
+	}
+
+	// Populate metrics from garth data
+	if ga.AverageHR > 0 {
+		activity.Metrics.AvgHeartRate = int(ga.AverageHR)
+	}
+	if ga.MaxHR > 0 {
+		activity.Metrics.MaxHeartRate = int(ga.MaxHR)
+	}
+	if ga.AverageSpeed > 0 {
+		// Convert m/s to km/h
+		activity.Metrics.AvgSpeed = ga.AverageSpeed * 3.6
+	}
+	if ga.ElevationGain > 0 {
+		activity.Metrics.ElevationGain = ga.ElevationGain
+	}
+	if ga.ElevationLoss > 0 {
+		activity.Metrics.ElevationLoss = ga.ElevationLoss
+	}
+	if ga.AverageSpeed > 0 && ga.Distance > 0 {
+		// Calculate pace: seconds per km
+		activity.Metrics.AvgPace = (ga.Duration / ga.Distance) * 1000
+	}
+
+	return activity
+}
+
 func (c *Client) DownloadActivityFile(ctx context.Context, activityID string, format string, logger Logger) ([]byte, error) {
 	if logger == nil {
 		logger = &NoopLogger{}
@@ -267,17 +260,9 @@ func (c *Client) DownloadActivityFile(ctx context.Context, activityID string, fo
 		}
 	}
 
-	// Construct download URL based on format
-	var path string
-	switch format {
-	case "gpx":
-		path = fmt.Sprintf("/download-service/export/gpx/activity/%s", activityID)
-	case "tcx":
-		path = fmt.Sprintf("/download-service/export/tcx/activity/%s", activityID)
-	case "fit":
-		path = fmt.Sprintf("/download-service/files/activity/%s", activityID)
-	default:
-		return nil, fmt.Errorf("unsupported file format: %s", format)
+	path, err := activityDownloadPath(activityID, format)
+	if err != nil {
+		return nil, err
 	}
 
 	// Wrap download with circuit breaker
@@ -293,3 +278,53 @@ func (c *Client) DownloadActivityFile(ctx context.Context, activityID string, fo
 	logger.Infof("Successfully downloaded %s file for activity %s (%d bytes)", format, activityID, len(data))
 	return data, nil
 }
+
+// DownloadActivityFileTo streams the activity file for the given format into w
+// and returns the number of bytes written. Unlike DownloadActivityFile the
+// payload is never buffered in memory, which matters once several sync
+// workers are downloading concurrently.
+func (c *Client) DownloadActivityFileTo(ctx context.Context, activityID string, format string, w io.Writer, logger Logger) (int64, error) {
+	if logger == nil {
+		logger = &NoopLogger{}
+	}
+	logger.Infof("Downloading %s file for activity %s", format, activityID)
+
+	if c.garthClient == nil {
+		if err := c.Connect(logger); err != nil {
+			return 0, err
+		}
+	}
+
+	path, err := activityDownloadPath(activityID, format)
+	if err != nil {
+		return 0, err
+	}
+
+	// Wrap download with circuit breaker
+	resp, err := c.cb.Execute(func() (interface{}, error) {
+		return c.garthClient.DownloadTo(path, w)
+	})
+	if err != nil {
+		logger.Errorf("Failed to download %s file for activity %s (circuit breaker): %v", format, activityID, err)
+		return 0, err
+	}
+	n := resp.(int64)
+
+	logger.Infof("Successfully downloaded %s file for activity %s (%d bytes)", format, activityID, n)
+	return n, nil
+}
+
+// activityDownloadPath maps an activity ID and file format onto the Connect
+// API download path.
+func activityDownloadPath(activityID, format string) (string, error) {
+	switch format {
+	case "gpx":
+		return fmt.Sprintf("/download-service/export/gpx/activity/%s", activityID), nil
+	case "tcx":
+		return fmt.Sprintf("/download-service/export/tcx/activity/%s", activityID), nil
+	case "fit":
+		return fmt.Sprintf("/download-service/files/activity/%s", activityID), nil
+	default:
+		return "", fmt.Errorf("unsupported file format: %s", format)
+	}
+}
@@ -6,16 +6,37 @@ import (
 	"github.com/sstent/fitness-tui/internal/tui/models"
 )
 
+// MockClient is a test double for GarminClient. The compile-time assertion
+// below keeps its method set in lockstep with the real interface.
 type MockClient struct {
 	ConnectError       error
 	Activities         []*models.Activity
 	GetActivitiesError error
+	FileData           []byte
+	DownloadError      error
 }
 
-func (m *MockClient) Connect() error {
+var _ GarminClient = (*MockClient)(nil)
+
+func (m *MockClient) Connect(logger Logger) error {
 	return m.ConnectError
 }
 
-func (m *MockClient) GetActivities(ctx context.Context, limit int) ([]*models.Activity, error) {
+func (m *MockClient) GetActivities(ctx context.Context, limit int, logger Logger) ([]*models.Activity, error) {
 	return m.Activities, m.GetActivitiesError
 }
+
+func (m *MockClient) GetAllActivities(ctx context.Context, logger Logger) ([]models.Activity, error) {
+	if m.GetActivitiesError != nil {
+		return nil, m.GetActivitiesError
+	}
+	activities := make([]models.Activity, 0, len(m.Activities))
+	for _, a := range m.Activities {
+		activities = append(activities, *a)
+	}
+	return activities, nil
+}
+
+func (m *MockClient) DownloadActivityFile(ctx context.Context, activityID string, format string, logger Logger) ([]byte, error) {
+	return m.FileData, m.DownloadError
+}
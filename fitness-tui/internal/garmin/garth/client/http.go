@@ -68,11 +68,21 @@ func (c *Client) ConnectAPI(path, method string, data interface{}) (interface{},
 }
 
 func (c *Client) Download(path string) ([]byte, error) {
+	var buf bytes.Buffer
+	if _, err := c.DownloadTo(path, &buf); err != nil {
+		return nil, err
+	}
+	return buf.Bytes(), nil
+}
+
+// DownloadTo streams a download into w instead of buffering the whole payload
+// in memory, so large activity files can be written straight to disk.
+func (c *Client) DownloadTo(path string, w io.Writer) (int64, error) {
 	url := fmt.Sprintf("https://connectapi.%s%s", c.Domain, path)
 	req, err := http.NewRequest("GET", url, nil)
 	if err != nil {
 		// Wrap with APIError for consistency
-		return nil, &errors.APIError{GarthHTTPError: errors.GarthHTTPError{
+		return 0, &errors.APIError{GarthHTTPError: errors.GarthHTTPError{
 			GarthError: errors.GarthError{Message: "Failed to create download request", Cause: err}}}
 	}
 
@@ -81,20 +91,26 @@ func (c *Client) Download(path string) ([]byte, error) {
 
 	resp, err := c.HTTPClient.Do(req)
 	if err != nil {
-		return nil, &errors.APIError{GarthHTTPError: errors.GarthHTTPError{
+		return 0, &errors.APIError{GarthHTTPError: errors.GarthHTTPError{
 			GarthError: errors.GarthError{Message: "Download request failed", Cause: err}}}
 	}
 	defer resp.Body.Close()
 
 	if resp.StatusCode >= 400 {
 		bodyBytes, _ := io.ReadAll(resp.Body)
-		return nil, &errors.APIError{GarthHTTPError: errors.GarthHTTPError{
+		return 0, &errors.APIError{GarthHTTPError: errors.GarthHTTPError{
 			StatusCode: resp.StatusCode,
 			Response:   string(bodyBytes),
 			GarthError: errors.GarthError{Message: fmt.Sprintf("Download failed: %s", resp.Status)}}}
 	}
 
-	return io.ReadAll(resp.Body)
+	n, err := io.Copy(w, resp.Body)
+	if err != nil {
+		return n, &errors.IOError{GarthError: errors.GarthError{
+			Message: "Failed to stream download", Cause: err}}
+	}
+
+	return n, nil
 }
 
 func (c *Client) Upload(filePath, uploadPath string) (map[string]interface{}, error) {
@@ -73,22 +73,24 @@ type CustomTime struct {
 	time.Time
 }
 
+// timeFormats lists Garmin's timestamp layouts in observed-frequency order;
+// UnmarshalJSON runs once per activity field on every API page, so the slice
+// lives at package level instead of being rebuilt each call.
+var timeFormats = []string{
+	"2006-01-02T15:04:05.999",
+	"2006-01-02 15:04:05",
+	time.RFC3339,
+}
+
 func (ct *CustomTime) UnmarshalJSON(b []byte) error {
 	s := strings.Trim(string(b), "\"")
 	if s == "null" || s == "" {
 		return nil
 	}
 
-	// Try different timestamp formats
-	formats := []string{
-		"2006-01-02T15:04:05.999",
-		"2006-01-02 15:04:05",
-		time.RFC3339,
-	}
-
 	var t time.Time
 	var err error
-	for _, format := range formats {
+	for _, format := range timeFormats {
 		t, err = time.Parse(format, s)
 		if err == nil {
 			ct.Time = t
@@ -154,11 +154,15 @@ func DateRange(end time.Time, days int) []time.Time {
 	return dates
 }
 
+// Compiled once at package load; CamelToSnake runs per map key during
+// response conversion, so per-call compilation would dominate its cost
+var (
+	matchFirstCap = regexp.MustCompile("(.)([A-Z][a-z]+)")
+	matchAllCap   = regexp.MustCompile("([a-z0-9])([A-Z])")
+)
+
 // CamelToSnake converts a camelCase string to snake_case
 func CamelToSnake(s string) string {
-	matchFirstCap := regexp.MustCompile("(.)([A-Z][a-z]+)")
-	matchAllCap := regexp.MustCompile("([a-z0-9])([A-Z])")
-
 	snake := matchFirstCap.ReplaceAllString(s, "${1}_${2}")
 	snake = matchAllCap.ReplaceAllString(snake, "${1}_${2}")
 	return strings.ToLower(snake)
@@ -1,10 +1,12 @@
 package garmin
 
 import (
+	"bufio"
 	"fmt"
 	"log"
 	"os"
 	"path/filepath"
+	"sync"
 )
 
 // Logger defines the interface for logging in Garmin operations
@@ -42,10 +44,33 @@ func (l *NoopLogger) Infof(format string, args ...interface{})  {}
 func (l *NoopLogger) Warnf(format string, args ...interface{})  {}
 func (l *NoopLogger) Errorf(format string, args ...interface{}) {}
 
-// FileLogger implements Logger that writes to a file
+// lockedWriter buffers writes to the log file behind its own mutex so a
+// Flush can't interleave with a line being written from another goroutine.
+type lockedWriter struct {
+	mu  sync.Mutex
+	buf *bufio.Writer
+}
+
+func (w *lockedWriter) Write(p []byte) (int, error) {
+	w.mu.Lock()
+	defer w.mu.Unlock()
+	return w.buf.Write(p)
+}
+
+func (w *lockedWriter) Flush() error {
+	w.mu.Lock()
+	defer w.mu.Unlock()
+	return w.buf.Flush()
+}
+
+// FileLogger implements Logger that writes to a file. Lines are buffered —
+// the sync path logs several lines per activity across multiple workers, and
+// a write syscall per line is most of the logging cost. Errors flush
+// immediately so they reach disk even if the process dies.
 type FileLogger struct {
 	logger *log.Logger
 	file   *os.File
+	out    *lockedWriter
 }
 
 func NewFileLogger(logPath string) (*FileLogger, error) {
@@ -60,10 +85,12 @@ func NewFileLogger(logPath string) (*FileLogger, error) {
 		return nil, fmt.Errorf("failed to open log file: %w", err)
 	}
 
-	logger := log.New(file, "", log.LstdFlags)
+	out := &lockedWriter{buf: bufio.NewWriter(file)}
+	logger := log.New(out, "", log.LstdFlags)
 	return &FileLogger{
 		logger: logger,
 		file:   file,
+		out:    out,
 	}, nil
 }
 
@@ -81,8 +108,13 @@ func (l *FileLogger) Warnf(format string, args ...interface{}) {
 
 func (l *FileLogger) Errorf(format string, args ...interface{}) {
 	l.logger.Printf("[ERROR] "+format, args...)
+	l.out.Flush()
 }
 
 func (l *FileLogger) Close() error {
+	if err := l.out.Flush(); err != nil {
+		l.file.Close()
+		return err
+	}
 	return l.file.Close()
 }
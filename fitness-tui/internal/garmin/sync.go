@@ -3,11 +3,19 @@ package garmin
 import (
 	"context"
 	"fmt"
+	"io"
+	"strings"
+	"sync"
 	"time"
 
 	"github.com/sstent/fitness-tui/internal/storage"
+	"github.com/sstent/fitness-tui/internal/tui/models"
 )
 
+// maxConcurrentDownloads bounds how many activity files are fetched in
+// parallel during a sync.
+const maxConcurrentDownloads = 4
+
 // Sync performs the complete synchronization process
 func (c *Client) Sync(ctx context.Context, storage *storage.ActivityStorage, logger Logger) (int, error) {
 	// Create a context with timeout for the entire sync process
@@ -19,7 +27,9 @@ func (c *Client) Sync(ctx context.Context, storage *storage.ActivityStorage, log
 	if err := c.Connect(logger); err != nil {
 		logger.Errorf("Authentication failed: %v", err)
 		if _, ok := err.(*AuthenticationError); ok {
-			return 0, fmt.Errorf("authentication failed: please check your credentials and try again")
+			// Wrap rather than replace so callers can still unwrap the
+			// typed cause
+			return 0, fmt.Errorf("please check your credentials and try again: %w", err)
 		}
 		return 0, err
 	}
@@ -34,79 +44,128 @@ func (c *Client) Sync(ctx context.Context, storage *storage.ActivityStorage, log
 	}
 	logger.Infof("Found %d activities", len(activities))
 
-	// Download files for each activity
-	downloadedFiles := 0
+	// Each activity is independent and dominated by a network round trip,
+	// so download files with a small worker pool instead of one at a time
+	jobs := make(chan int, len(activities))
 	for i := range activities {
-		activity := &activities[i]
-		// Check if context has been cancelled
-		select {
-		case <-timeoutCtx.Done():
-			logger.Warnf("Sync cancelled due to timeout")
-			return downloadedFiles, timeoutCtx.Err()
-		default:
-		}
+		jobs <- i
+	}
+	close(jobs)
+
+	workers := maxConcurrentDownloads
+	if workers > len(activities) {
+		workers = len(activities)
+	}
+
+	var (
+		wg              sync.WaitGroup
+		mu              sync.Mutex
+		downloadedFiles int
+	)
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range jobs {
+				// Check if context has been cancelled
+				select {
+				case <-timeoutCtx.Done():
+					logger.Warnf("Sync cancelled due to timeout")
+					return
+				default:
+				}
 
-		logger.Infof("Processing activity %d/%d: %s", i+1, len(activities), activity.Name)
-
-		// Only download if file doesn't exist
-		if activity.FilePath == "" {
-			logger.Infof("File missing for activity %s, attempting download...", activity.ID)
-			var data []byte
-			var format string
-			var err error
-
-			// First try FIT (preferred)
-			logger.Infof("Trying FIT download for %s...", activity.ID)
-			data, err = c.DownloadActivityFile(timeoutCtx, activity.ID, "fit", logger)
-			if err == nil {
-				format = "fit"
-				logger.Infof("FIT download successful for %s (%d bytes)", activity.ID, len(data))
-			} else {
-				logger.Warnf("FIT download failed for %s: %v", activity.ID, err)
-
-				// Fallback to GPX
-				logger.Infof("Trying GPX download for %s...", activity.ID)
-				data, err = c.DownloadActivityFile(timeoutCtx, activity.ID, "gpx", logger)
-				if err == nil {
-					format = "gpx"
-					logger.Infof("GPX download successful for %s (%d bytes)", activity.ID, len(data))
-				} else {
-					logger.Warnf("GPX download failed for %s: %v", activity.ID, err)
-
-					// Fallback to TCX
-					logger.Infof("Trying TCX download for %s...", activity.ID)
-					data, err = c.DownloadActivityFile(timeoutCtx, activity.ID, "tcx", logger)
-					if err != nil {
-						logger.Errorf("TCX download failed for %s: %v", activity.ID, err)
-						continue
-					}
-					format = "tcx"
-					logger.Infof("TCX download successful for %s (%d bytes)", activity.ID, len(data))
+				if c.syncActivity(timeoutCtx, storage, logger, &activities[i], i, len(activities)) {
+					mu.Lock()
+					downloadedFiles++
+					mu.Unlock()
 				}
 			}
+		}()
+	}
+	wg.Wait()
+
+	if err := timeoutCtx.Err(); err != nil {
+		return downloadedFiles, err
+	}
+	return downloadedFiles, nil
+}
 
-			// Save file to storage
-			logger.Infof("Saving %s file for %s...", format, activity.ID)
-			filePath, err := storage.SaveActivityFile(activity, data, format)
+// syncActivity downloads the file for a single activity if needed and saves
+// its metadata. It reports whether a new file was downloaded.
+func (c *Client) syncActivity(ctx context.Context, storage *storage.ActivityStorage, logger Logger, activity *models.Activity, index, total int) bool {
+	logger.Infof("Processing activity %d/%d: %s", index+1, total, activity.Name)
+
+	// The API response never carries a file path, so consult local
+	// storage first: activities we've already synced keep their file
+	// and skip the download entirely
+	storedPath, alreadyStored := storage.StoredFilePath(activity.ID)
+	if activity.FilePath == "" {
+		activity.FilePath = storedPath
+	}
+
+	// Only download if file doesn't exist
+	fileDownloaded := false
+	if activity.FilePath == "" {
+		logger.Infof("File missing for activity %s, attempting download...", activity.ID)
+
+		// FIT preferred, then GPX, then TCX. The payload is streamed
+		// straight into the target file rather than buffered whole, which
+		// keeps memory flat with several download workers running. A failed
+		// attempt discards its temp file, so falling back is safe.
+		for _, format := range []string{"fit", "gpx", "tcx"} {
+			logger.Infof("Trying %s download for %s...", strings.ToUpper(format), activity.ID)
+			var n int64
+			filePath, err := storage.SaveActivityFileStream(activity, format, func(w io.Writer) error {
+				var err error
+				n, err = c.DownloadActivityFileTo(ctx, activity.ID, format, w, logger)
+				return err
+			})
 			if err != nil {
-				logger.Errorf("Failed to save activity file for %s: %v", activity.ID, err)
+				logger.Warnf("%s download failed for %s: %v", strings.ToUpper(format), activity.ID, err)
 				continue
 			}
-			logger.Infof("Saved file to %s", filePath)
+			logger.Infof("%s download successful for %s (%d bytes), saved to %s", strings.ToUpper(format), activity.ID, n, filePath)
 
 			// Update activity with file path
 			activity.FilePath = filePath
-			downloadedFiles++
-		} else {
-			logger.Infof("File already exists for %s: %s", activity.ID, activity.FilePath)
+			fileDownloaded = true
+			break
+		}
+		if !fileDownloaded {
+			logger.Errorf("All download formats failed for %s", activity.ID)
+			return false
 		}
+	} else {
+		logger.Infof("File already exists for %s: %s", activity.ID, activity.FilePath)
+	}
 
-		// Save updated activity metadata
+	// Persist metadata only when something changed; rewriting
+	// identical metadata costs an fsync per activity on re-syncs.
+	// For already-stored activities that means actually comparing against
+	// the stored copy, so upstream edits (renames, corrected totals) still
+	// land locally.
+	needsSave := fileDownloaded || !alreadyStored
+	if !needsSave {
+		stored, err := storage.Get(activity.ID)
+		needsSave = err != nil || !activityUnchanged(stored, activity)
+		if needsSave && err == nil {
+			logger.Infof("Metadata changed upstream for %s", activity.ID)
+		}
+	}
+	if needsSave {
 		logger.Infof("Saving metadata for %s...", activity.ID)
 		if err := storage.Save(activity); err != nil {
 			logger.Errorf("Failed to save activity metadata for %s: %v", activity.ID, err)
 		}
 	}
 
-	return downloadedFiles, nil
+	return fileDownloaded
+}
+
+// activityUnchanged reports whether the fetched metadata matches the stored
+// copy, comparing content hashes rather than field by field so new model
+// fields can't silently fall out of the comparison.
+func activityUnchanged(stored, fetched *models.Activity) bool {
+	return storage.ContentHash(stored) == storage.ContentHash(fetched)
 }
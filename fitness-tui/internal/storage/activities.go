@@ -3,10 +3,13 @@ package storage
 import (
 	"encoding/json"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
+	"runtime"
 	"sort"
 	"strings"
+	"sync"
 
 	"github.com/sstent/fitness-tui/internal/tui/models"
 )
@@ -14,15 +17,23 @@ import (
 type ActivityStorage struct {
 	dataDir  string
 	lockPath string
+
+	mu    sync.Mutex
+	index map[string]indexEntry // keyed by activity ID
 }
 
-func NewActivityStorage(dataDir string) *ActivityStorage {
-	activitiesDir := filepath.Join(dataDir, "activities")
-	os.MkdirAll(activitiesDir, 0755)
+// indexEntry carries the per-activity fields the sync loop needs so it can
+// answer existence and file-path lookups without re-reading metadata files.
+type indexEntry struct {
+	filename string // metadata filename within the activities dir
+	filePath string // saved activity file (FIT/GPX/TCX), if any
+}
 
-	// Create directory for activity files
-	filesDir := filepath.Join(dataDir, "activity_files")
-	os.MkdirAll(filesDir, 0755)
+func NewActivityStorage(dataDir string) *ActivityStorage {
+	// Create metadata and activity file directories in one pass
+	for _, dir := range []string{"activities", "activity_files"} {
+		os.MkdirAll(filepath.Join(dataDir, dir), 0755)
+	}
 
 	return &ActivityStorage{
 		dataDir:  dataDir,
@@ -52,16 +63,40 @@ func (s *ActivityStorage) ReleaseLock() error {
 }
 
 func (s *ActivityStorage) Save(activity *models.Activity) error {
+	return s.writeActivity(activity, true)
+}
+
+// SaveAll writes a batch of activities in one pass. Unlike repeated Save
+// calls, it skips the per-file fsync and syncs the activities directory once
+// at the end, which is substantially cheaper when ingesting hundreds of
+// activities from a sync.
+func (s *ActivityStorage) SaveAll(activities []*models.Activity) error {
+	for _, activity := range activities {
+		if err := s.writeActivity(activity, false); err != nil {
+			return err
+		}
+	}
+
+	// A single directory sync covers all the renames above
+	dir, err := os.Open(filepath.Join(s.dataDir, "activities"))
+	if err != nil {
+		return fmt.Errorf("failed to open activities directory: %w", err)
+	}
+	defer dir.Close()
+
+	if err := dir.Sync(); err != nil {
+		return fmt.Errorf("failed to sync activities directory: %w", err)
+	}
+
+	return nil
+}
+
+func (s *ActivityStorage) writeActivity(activity *models.Activity, syncFile bool) error {
 	filename := fmt.Sprintf("%s-%s.json",
 		activity.Date.Format("2006-01-02"),
 		sanitizeFilename(activity.Name))
 	targetPath := filepath.Join(s.dataDir, "activities", filename)
 
-	data, err := json.MarshalIndent(activity, "", "  ")
-	if err != nil {
-		return fmt.Errorf("failed to marshal activity: %w", err)
-	}
-
 	// Atomic write using temp file and rename
 	tmpFile, err := os.CreateTemp(filepath.Dir(targetPath), "tmp-*.json")
 	if err != nil {
@@ -69,13 +104,21 @@ func (s *ActivityStorage) Save(activity *models.Activity) error {
 	}
 	defer os.Remove(tmpFile.Name())
 
-	if _, err := tmpFile.Write(data); err != nil {
+	// Encode straight into the file instead of materializing the indented
+	// JSON as a byte slice first; keeps bulk saves from double-buffering
+	// every activity
+	enc := json.NewEncoder(tmpFile)
+	enc.SetIndent("", "  ")
+	if err := enc.Encode(activity); err != nil {
 		return fmt.Errorf("failed to write activity data: %w", err)
 	}
 
-	// Sync to ensure write completes before rename
-	if err := tmpFile.Sync(); err != nil {
-		return fmt.Errorf("failed to sync temp file: %w", err)
+	// Sync to ensure write completes before rename (skipped on bulk writes,
+	// where SaveAll syncs the directory once instead)
+	if syncFile {
+		if err := tmpFile.Sync(); err != nil {
+			return fmt.Errorf("failed to sync temp file: %w", err)
+		}
 	}
 
 	if err := tmpFile.Close(); err != nil {
@@ -86,21 +129,46 @@ func (s *ActivityStorage) Save(activity *models.Activity) error {
 		return fmt.Errorf("failed to atomically replace activity file: %w", err)
 	}
 
+	// Keep the existence index in step with what's on disk
+	s.mu.Lock()
+	if s.index != nil {
+		s.index[activity.ID] = indexEntry{filename: filename, filePath: activity.FilePath}
+	}
+	s.mu.Unlock()
+
 	return nil
 }
 
-// SaveActivityFile saves the activity file (GPX/TCX) and returns the relative path to the file
-func (s *ActivityStorage) SaveActivityFile(activity *models.Activity, content []byte, format string) (string, error) {
+// SaveActivityFileStream saves an activity file by handing write the
+// destination writer, so downloads can stream straight to disk instead of
+// buffering the whole payload. The content goes through a temp file and is
+// only renamed into place if write succeeds, so a failed or partial download
+// never leaves a truncated activity file behind.
+func (s *ActivityStorage) SaveActivityFileStream(activity *models.Activity, format string, write func(io.Writer) error) (string, error) {
 	filename := fmt.Sprintf("%s.%s", activity.ID, format)
 	targetPath := filepath.Join(s.dataDir, "activity_files", filename)
 
-	if err := os.WriteFile(targetPath, content, 0644); err != nil {
-		return "", fmt.Errorf("failed to write activity file: %w", err)
+	tmpFile, err := os.CreateTemp(filepath.Dir(targetPath), "tmp-*")
+	if err != nil {
+		return "", fmt.Errorf("failed to create temp file: %w", err)
+	}
+	defer os.Remove(tmpFile.Name())
+
+	if err := write(tmpFile); err != nil {
+		tmpFile.Close()
+		return "", err
+	}
+
+	if err := tmpFile.Close(); err != nil {
+		return "", fmt.Errorf("failed to close temp file: %w", err)
+	}
+
+	if err := os.Rename(tmpFile.Name(), targetPath); err != nil {
+		return "", fmt.Errorf("failed to atomically replace activity file: %w", err)
 	}
 
 	// Return the relative path within the dataDir
-	relativePath := filepath.Join("activity_files", filename)
-	return relativePath, nil
+	return filepath.Join("activity_files", filename), nil
 }
 
 func (s *ActivityStorage) LoadAll() ([]*models.Activity, error) {
@@ -111,17 +179,48 @@ func (s *ActivityStorage) LoadAll() ([]*models.Activity, error) {
 		return nil, err
 	}
 
-	var activities []*models.Activity
+	var paths []string
 	for _, file := range files {
 		if filepath.Ext(file.Name()) != ".json" {
 			continue
 		}
+		paths = append(paths, filepath.Join(activitiesDir, file.Name()))
+	}
 
-		activity, err := s.loadActivity(filepath.Join(activitiesDir, file.Name()))
-		if err != nil {
-			continue // Skip invalid files
+	// Read and decode files in parallel; JSON decoding dominates load time
+	// once a few hundred activities are stored
+	workers := runtime.NumCPU()
+	if workers > len(paths) {
+		workers = len(paths)
+	}
+
+	loaded := make([]*models.Activity, len(paths))
+	jobs := make(chan int)
+	var wg sync.WaitGroup
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range jobs {
+				activity, err := s.loadActivity(paths[i])
+				if err != nil {
+					continue // Skip invalid files
+				}
+				loaded[i] = activity
+			}
+		}()
+	}
+	for i := range paths {
+		jobs <- i
+	}
+	close(jobs)
+	wg.Wait()
+
+	var activities []*models.Activity
+	for _, activity := range loaded {
+		if activity != nil {
+			activities = append(activities, activity)
 		}
-		activities = append(activities, activity)
 	}
 
 	sort.Slice(activities, func(i, j int) bool {
@@ -132,24 +231,87 @@ func (s *ActivityStorage) LoadAll() ([]*models.Activity, error) {
 }
 
 func (s *ActivityStorage) Get(id string) (*models.Activity, error) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+
+	if err := s.ensureIndex(); err != nil {
+		return nil, fmt.Errorf("failed to read activities directory: %w", err)
+	}
+
+	if entry, ok := s.index[id]; ok {
+		return s.loadActivity(filepath.Join(s.dataDir, "activities", entry.filename))
+	}
+
+	return nil, fmt.Errorf("activity %s not found", id)
+}
+
+// StoredFilePath returns the saved activity-file path for an ID straight from
+// the index, so sync loops avoid a metadata decode per stored activity.
+func (s *ActivityStorage) StoredFilePath(id string) (string, bool) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+
+	if err := s.ensureIndex(); err != nil {
+		return "", false
+	}
+
+	entry, ok := s.index[id]
+	if !ok {
+		return "", false
+	}
+	return entry.filePath, true
+}
+
+// ensureIndex builds the ID -> filename index with a single directory scan.
+// Must be called with s.mu held.
+func (s *ActivityStorage) ensureIndex() error {
+	if s.index != nil {
+		return nil
+	}
+
 	activitiesDir := filepath.Join(s.dataDir, "activities")
 	files, err := os.ReadDir(activitiesDir)
 	if err != nil {
-		return nil, fmt.Errorf("failed to read activities directory: %w", err)
+		return err
 	}
 
+	index := make(map[string]indexEntry, len(files))
 	for _, file := range files {
 		if filepath.Ext(file.Name()) != ".json" {
 			continue
 		}
 
-		// Check if filename contains the activity ID
-		if strings.Contains(file.Name(), id) {
-			return s.loadActivity(filepath.Join(activitiesDir, file.Name()))
+		stub, err := loadActivityStub(filepath.Join(activitiesDir, file.Name()))
+		if err != nil {
+			continue // Skip invalid files
 		}
+		index[stub.ID] = indexEntry{filename: file.Name(), filePath: stub.FilePath}
 	}
 
-	return nil, fmt.Errorf("activity %s not found", id)
+	s.index = index
+	return nil
+}
+
+// activityStub projects just the fields the index needs; decoding full
+// activities (raw metric streams included) makes index builds needlessly
+// expensive.
+type activityStub struct {
+	ID       string
+	FilePath string
+}
+
+func loadActivityStub(path string) (*activityStub, error) {
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return nil, err
+	}
+
+	var stub activityStub
+	if err := json.Unmarshal(data, &stub); err != nil {
+		return nil, err
+	}
+
+	return &stub, nil
 }
 
 func (s *ActivityStorage) loadActivity(path string) (*models.Activity, error) {
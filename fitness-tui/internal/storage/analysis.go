@@ -2,6 +2,9 @@ package storage
 
 import (
 	"bytes"
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -26,6 +29,19 @@ func NewAnalysisCache(storagePath string) *AnalysisCache {
 	}
 }
 
+// ContentHash fingerprints the activity data an analysis was generated from.
+// Storing it in the metadata lets cache hits be validated against the
+// activity's current content: an unchanged hash means the expensive LLM call
+// can be skipped, a changed one means the cached analysis is stale.
+func ContentHash(activity *models.Activity) string {
+	data, err := json.Marshal(activity)
+	if err != nil {
+		return ""
+	}
+	sum := sha256.Sum256(data)
+	return hex.EncodeToString(sum[:])
+}
+
 type AnalysisMetadata struct {
 	ActivityID  string    `yaml:"activity_id"`
 	GeneratedAt time.Time `yaml:"generated_at"`
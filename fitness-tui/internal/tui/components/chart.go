@@ -38,19 +38,20 @@ func NewChart(data []float64, title, unit string, width, height int, color lipgl
 	}
 
 	if len(data) > 0 {
-		// Use downsampled data for min/max to improve performance
-		// Using empty timestamps array since we only need value downsampling
-		downsampled := types.DownsampleLTTB(data, make([]time.Time, len(data)), width)
-		c.Downsampled = downsampled
-		values := make([]float64, len(downsampled))
-		for i, point := range downsampled {
-			values[i] = point.Value
-		}
-		c.Min, c.Max = minMax(values)
+		c.downsample()
 	}
 	return c
 }
 
+// downsample recomputes the downsampled series and its min/max for the
+// current width. Min/max are taken straight off the downsampled points so no
+// intermediate value slice is copied out on every recompute.
+func (c *Chart) downsample() {
+	// Using empty timestamps array since we only need value downsampling
+	c.Downsampled = types.DownsampleLTTB(c.Data, make([]time.Time, len(c.Data)), c.Width)
+	c.Min, c.Max = minMaxPoints(c.Downsampled)
+}
+
 // NewBarChart creates a bar chart with axis labels
 func NewBarChart(data []float64, title string, width, height int, color lipgloss.Color, xLabels []string, yMax float64) *Chart {
 	c := NewChart(data, title, "", width, height, color)
@@ -76,12 +77,7 @@ func (c *Chart) View() string {
 
 	// Recalculate if dimensions changed
 	if len(c.Downsampled) != c.Width {
-		c.Downsampled = types.DownsampleLTTB(c.Data, make([]time.Time, len(c.Data)), c.Width)
-		values := make([]float64, len(c.Downsampled))
-		for i, point := range c.Downsampled {
-			values[i] = point.Value
-		}
-		c.Min, c.Max = minMax(values)
+		c.downsample()
 	}
 
 	return lipgloss.NewStyle().
@@ -118,6 +114,13 @@ func (c *Chart) renderBarChart() string {
 	}
 	scale := float64(chartHeight-1) / maxValue
 
+	// Each bar's height is the same on every row, so derive it once here
+	// rather than height times per column inside the row loop
+	barHeights := make([]int, len(c.Downsampled))
+	for i, point := range c.Downsampled {
+		barHeights[i] = int(math.Round(point.Value * scale))
+	}
+
 	// Y-axis labels
 	yIncrement := maxValue / float64(chartHeight-1)
 	for i := chartHeight - 1; i >= 0; i-- {
@@ -129,8 +132,7 @@ func (c *Chart) renderBarChart() string {
 		}
 
 		// Draw bars
-		for _, point := range c.Downsampled {
-			barHeight := int(math.Round(point.Value * scale))
+		for _, barHeight := range barHeights {
 			if barHeight >= i {
 				sb.WriteString("#")
 			} else {
@@ -163,6 +165,9 @@ func (c *Chart) renderSparkline() string {
 	maxLabel := fmt.Sprintf("%.0f%s", c.Max, c.Unit)
 	sb.WriteString(fmt.Sprintf("%5s ", maxLabel))
 
+	// Accumulate the glyphs unstyled and color the whole row in one pass;
+	// styling per character would emit an ANSI escape pair per cell
+	var bar strings.Builder
 	for i, point := range c.Downsampled {
 		if i >= c.Width {
 			break
@@ -170,8 +175,9 @@ func (c *Chart) renderSparkline() string {
 
 		normalized := (point.Value - c.Min) / (c.Max - c.Min)
 		barHeight := int(math.Round(normalized * float64(chartHeight-1)))
-		sb.WriteString(c.renderBar(barHeight, chartHeight))
+		bar.WriteString(barGlyph(barHeight, chartHeight))
 	}
+	sb.WriteString(lipgloss.NewStyle().Foreground(c.Color).Render(bar.String()))
 	sb.WriteString("\n")
 
 	// Add X axis with min label
@@ -180,21 +186,20 @@ func (c *Chart) renderSparkline() string {
 	return sb.String()
 }
 
-func (c *Chart) renderBar(height, maxHeight int) string {
+// Unicode block characters for better resolution
+var sparkBlocks = []string{" ", "▁", "▂", "▃", "▄", "▅", "▆", "▇", "█"}
+
+func barGlyph(height, maxHeight int) string {
 	if height <= 0 {
 		return " "
 	}
 
-	// Use Unicode block characters for better resolution
-	blocks := []string{" ", "▁", "▂", "▃", "▄", "▅", "▆", "▇", "█"}
 	index := int(float64(height) / float64(maxHeight) * 8)
-	if index >= len(blocks) {
-		index = len(blocks) - 1
+	if index >= len(sparkBlocks) {
+		index = len(sparkBlocks) - 1
 	}
 
-	return lipgloss.NewStyle().
-		Foreground(c.Color).
-		Render(blocks[index])
+	return sparkBlocks[index]
 }
 
 func (c *Chart) renderNoData() string {
@@ -215,17 +220,17 @@ func (c *Chart) renderConstantData() string {
 		Render(fmt.Sprintf("%s: Constant value %.2f", c.Title, c.Data[0]))
 }
 
-func minMax(data []float64) (min, max float64) {
-	if len(data) == 0 {
+func minMaxPoints(points []types.DownsampledPoint) (min, max float64) {
+	if len(points) == 0 {
 		return 0, 0
 	}
-	min, max = data[0], data[0]
-	for _, v := range data {
-		if v < min {
-			min = v
+	min, max = points[0].Value, points[0].Value
+	for _, p := range points {
+		if p.Value < min {
+			min = p.Value
 		}
-		if v > max {
-			max = v
+		if p.Value > max {
+			max = p.Value
 		}
 	}
 	return min, max
@@ -51,10 +51,25 @@ type ActivityDetail struct {
 	analysisSpinner  spinner.Model
 	analysisProgress string
 	lastError        error // Store the last analysis error
+
+	// Built once with the screen; constructing the client per analysis
+	// request would throw away its connection pool and circuit-breaker state
+	analysisCache  *storage.AnalysisCache
+	analysisClient *analysis.OpenRouterClient
+
+	// Rendered tab bar, reused until the active tab or width changes
+	tabNavCache      string
+	tabNavCacheTab   int
+	tabNavCacheWidth int
+
+	// Rendered Overview/Charts tab bodies keyed by tab index; the activity
+	// never changes within a screen, so these only go stale on resize
+	tabContentCache map[int]string
+	tabContentWidth int
 }
 
 func NewActivityDetail(activity *models.Activity, analysis string, config *config.Config, logger garmin.Logger) *ActivityDetail {
-	st := styles.NewStyles()
+	st := styles.DefaultStyles()
 	if logger == nil {
 		logger = &garmin.NoopLogger{}
 	}
@@ -64,40 +79,37 @@ func NewActivityDetail(activity *models.Activity, analysis string, config *confi
 	s.Spinner = spinner.Dot
 	s.Style = lipgloss.NewStyle().Foreground(lipgloss.Color("205"))
 
+	// Charts are cheap in-memory downsamples, so build them inline; the nil
+	// guard matters because setContent renders a placeholder for a nil
+	// activity and never touches the charts
+	var hrChart, powerChart, elevationChart *components.Chart
+	if activity != nil {
+		hrChart = components.NewChart(
+			activity.Metrics.HeartRateData, "Heart Rate", "bpm",
+			40, 4, lipgloss.Color("#FF0000"))
+		powerChart = components.NewChart(
+			activity.Metrics.PowerData, "Power", "watts",
+			40, 4, lipgloss.Color("#00FF00"))
+		elevationChart = components.NewChart(
+			activity.Metrics.ElevationData, "Elevation", "m",
+			40, 4, lipgloss.Color("#0000FF"))
+	}
+
 	ad := &ActivityDetail{
-		activity: activity,
-		analysis: analysis,
-		viewport: vp,
-		logger:   logger,
-		config:   config,
-		styles:   st,
-		hrChart: components.NewChart(
-			activity.Metrics.HeartRateData,
-			"Heart Rate",
-			"bpm",
-			40,
-			4,
-			lipgloss.Color("#FF0000"),
-		),
-		powerChart: components.NewChart(
-			activity.Metrics.PowerData,
-			"Power",
-			"watts",
-			40,
-			4,
-			lipgloss.Color("#00FF00"),
-		),
-		elevationChart: components.NewChart(
-			activity.Metrics.ElevationData,
-			"Elevation",
-			"m",
-			40,
-			4,
-			lipgloss.Color("#0000FF"),
-		),
+		activity:         activity,
+		analysis:         analysis,
+		viewport:         vp,
+		logger:           logger,
+		config:           config,
+		styles:           st,
+		hrChart:          hrChart,
+		powerChart:       powerChart,
+		elevationChart:   elevationChart,
 		tabNames:         []string{"Overview", "Charts", "Analysis"},
 		analysisSpinner:  s,
 		analysisProgress: "Ready to analyze",
+		analysisCache:    storage.NewAnalysisCache(config.StoragePath),
+		analysisClient:   analysis.NewOpenRouterClient(config),
 	}
 	ad.setContent()
 	return ad
@@ -266,6 +278,13 @@ func (m *ActivityDetail) View() string {
 }
 
 func (m *ActivityDetail) renderTabNavigation() string {
+	// The bar only changes with the active tab or terminal width, but View
+	// runs on every message (spinner ticks included); serve the cached
+	// render instead of laying out three bordered boxes per frame
+	if m.tabNavCache != "" && m.tabNavCacheTab == m.currentTab && m.tabNavCacheWidth == m.styles.Dimensions.Width {
+		return m.tabNavCache
+	}
+
 	var tabs []string
 	tabWidth := (m.styles.Dimensions.Width - 8) / len(m.tabNames)
 
@@ -297,7 +316,10 @@ func (m *ActivityDetail) renderTabNavigation() string {
 		tabs = append(tabs, tabStyle.Render(tabName))
 	}
 
-	return lipgloss.JoinHorizontal(lipgloss.Top, tabs...) + "\n"
+	m.tabNavCache = lipgloss.JoinHorizontal(lipgloss.Top, tabs...) + "\n"
+	m.tabNavCacheTab = m.currentTab
+	m.tabNavCacheWidth = m.styles.Dimensions.Width
+	return m.tabNavCache
 }
 
 func (m *ActivityDetail) setContent() {
@@ -312,10 +334,21 @@ func (m *ActivityDetail) setContent() {
 	}
 
 	switch m.currentTab {
-	case 0: // Overview
-		content.WriteString(m.renderOverviewTab())
-	case 1: // Charts
-		content.WriteString(m.renderChartsTab())
+	case 0, 1: // Overview and Charts depend only on the activity and width
+		if m.tabContentCache == nil || m.tabContentWidth != m.styles.Dimensions.Width {
+			m.tabContentCache = make(map[int]string)
+			m.tabContentWidth = m.styles.Dimensions.Width
+		}
+		body, ok := m.tabContentCache[m.currentTab]
+		if !ok {
+			if m.currentTab == 0 {
+				body = m.renderOverviewTab()
+			} else {
+				body = m.renderChartsTab()
+			}
+			m.tabContentCache[m.currentTab] = body
+		}
+		content.WriteString(body)
 	case 2: // Analysis
 		content.WriteString(m.renderAnalysisTab())
 	}
@@ -496,14 +529,16 @@ func (m *ActivityDetail) renderChartsTab() string {
 
 func (m *ActivityDetail) generateAnalysisCmd(forceRefresh bool) tea.Cmd {
 	return func() tea.Msg {
-		// Create storage and analysis clients
-		analysisCache := storage.NewAnalysisCache(m.config.StoragePath)
-		analysisClient := analysis.NewOpenRouterClient(m.config)
+		analysisCache := m.analysisCache
+		analysisClient := m.analysisClient
 
-		// Check cache unless forcing refresh
+		// Check cache unless forcing refresh; a hit only counts if the
+		// activity's content hash still matches, so edits or re-syncs
+		// invalidate stale analyses instead of serving them forever
+		contentHash := storage.ContentHash(m.activity)
 		if !forceRefresh {
-			cachedContent, _, err := analysisCache.GetAnalysis(m.activity.ID)
-			if err == nil && cachedContent != "" {
+			cachedContent, meta, err := analysisCache.GetAnalysis(m.activity.ID)
+			if err == nil && cachedContent != "" && (meta.Hash == "" || meta.Hash == contentHash) {
 				return AnalysisCompleteMsg{
 					Analysis: cachedContent,
 				}
@@ -525,6 +560,7 @@ func (m *ActivityDetail) generateAnalysisCmd(forceRefresh bool) tea.Cmd {
 			ActivityID:  m.activity.ID,
 			GeneratedAt: time.Now(),
 			ModelUsed:   m.config.OpenRouter.Model,
+			Hash:        contentHash,
 		}
 		if err := analysisCache.StoreAnalysis(m.activity, analysisContent, meta); err != nil {
 			m.logger.Warnf("Failed to cache analysis: %v", err)
@@ -19,12 +19,14 @@ import (
 
 type ActivityList struct {
 	activities            []*models.Activity
-	totalGarminActivities int // Added for sync status
+	dateLabels            []string // formatted once per load, indexed like activities
+	totalGarminActivities int      // Added for sync status
 	storage               *storage.ActivityStorage
 	garminClient          garmin.GarminClient
 	config                *config.Config
 	layout                *layout.Layout
 	styles                *styles.Styles
+	typeColors            map[string]lipgloss.Color // cached per-type colors, built once
 	selectedIndex         int
 	statusMsg             string
 	isLoading             bool
@@ -33,18 +35,26 @@ type ActivityList struct {
 }
 
 func NewActivityList(storage *storage.ActivityStorage, client garmin.GarminClient, config *config.Config) *ActivityList {
+	st := styles.DefaultStyles()
 	return &ActivityList{
 		storage:      storage,
 		garminClient: client,
 		config:       config,
 		layout:       layout.NewLayout(80, 24), // Default size
-		styles:       styles.NewStyles(),
+		styles:       st,
+		typeColors: map[string]lipgloss.Color{
+			"cycling":  st.PrimaryBlue,
+			"running":  st.PrimaryGreen,
+			"swimming": st.PrimaryBlue,
+			"hiking":   st.PrimaryOrange,
+			"walking":  st.PrimaryYellow,
+		},
 	}
 }
 
 func (m *ActivityList) Init() tea.Cmd {
-	// Initialize Garmin connection synchronously for now
-	m.garminClient.Connect(&garmin.NoopLogger{})
+	// The Garmin client connects lazily on first use, so don't block the
+	// first paint on a network login here
 	return m.loadActivities
 }
 
@@ -103,6 +113,12 @@ func (m *ActivityList) Update(msg tea.Msg) (tea.Model, tea.Cmd) {
 
 	case activitiesLoadedMsg:
 		m.activities = msg.activities
+		// Format date labels once per load; rows re-render on every
+		// cursor move and the dates never change in between
+		m.dateLabels = make([]string, len(m.activities))
+		for i, activity := range m.activities {
+			m.dateLabels[i] = activity.Date.Format("2006-01-02")
+		}
 		if m.selectedIndex >= len(m.activities) {
 			m.selectedIndex = max(0, len(m.activities)-1)
 		}
@@ -195,8 +211,12 @@ func (m *ActivityList) View() string {
 		{Label: "Analytics", Key: "n"},
 	}
 
-	// Add sync status to nav bar
-	syncStatus := fmt.Sprintf("Synced: %d/%d", len(m.activities), m.totalGarminActivities)
+	// Add sync status to nav bar; the Garmin total is only known after a
+	// sync has run, so don't render a bogus "/0" before that
+	syncStatus := fmt.Sprintf("Synced: %d", len(m.activities))
+	if m.totalGarminActivities > 0 {
+		syncStatus = fmt.Sprintf("Synced: %d/%d", len(m.activities), m.totalGarminActivities)
+	}
 	navBar := m.styles.NavigationBar(navItems, 0)
 	statusStyle := lipgloss.NewStyle().Foreground(m.styles.MutedText).Align(lipgloss.Right)
 	statusText := statusStyle.Render(syncStatus)
@@ -252,49 +272,46 @@ func (m *ActivityList) renderActivityList() string {
 	startIdx := m.scrollOffset
 	endIdx := min(startIdx+visibleRows, len(m.activities))
 
-	// Activity type color mapping
-	typeColors := map[string]lipgloss.Color{
-		"cycling":  m.styles.PrimaryBlue,
-		"running":  m.styles.PrimaryGreen,
-		"swimming": m.styles.PrimaryBlue,
-		"hiking":   m.styles.PrimaryOrange,
-		"walking":  m.styles.PrimaryYellow,
-	}
+	// Row styles only differ per type color and selection, so build them
+	// once per frame here rather than once per row
+	dateStyle := lipgloss.NewStyle().Foreground(m.styles.MutedText)
+	nameStyle := lipgloss.NewStyle().Foreground(m.styles.LightText)
+	selDateStyle := dateStyle.Bold(true)
+	selNameStyle := nameStyle.Bold(true)
 
 	for i := startIdx; i < endIdx; i++ {
 		activity := m.activities[i]
 		isSelected := (i == m.selectedIndex)
 
 		// Get color for activity type, default to white
-		color, ok := typeColors[strings.ToLower(activity.Type)]
+		color, ok := m.typeColors[strings.ToLower(activity.Type)]
 		if !ok {
 			color = m.styles.LightText
 		}
 
 		// Format activity line
-		dateStr := activity.Date.Format("2006-01-02")
+		dateStr := m.dateLabels[i]
 		typeStr := activity.Type
 		nameStr := activity.Name
 
-		// Apply coloring
-		dateStyle := lipgloss.NewStyle().Foreground(m.styles.MutedText)
+		rowDateStyle := dateStyle
+		rowNameStyle := nameStyle
 		typeStyle := lipgloss.NewStyle().Foreground(color).Bold(true)
-		nameStyle := lipgloss.NewStyle().Foreground(m.styles.LightText)
 
 		if isSelected {
-			dateStyle = dateStyle.Bold(true)
-			typeStyle = typeStyle.Bold(true).Underline(true)
-			nameStyle = nameStyle.Bold(true)
+			rowDateStyle = selDateStyle
+			rowNameStyle = selNameStyle
+			typeStyle = typeStyle.Underline(true)
 			content.WriteString("> ")
 		} else {
 			content.WriteString("  ")
 		}
 
-		content.WriteString(dateStyle.Render(dateStr))
+		content.WriteString(rowDateStyle.Render(dateStr))
 		content.WriteString(" ")
 		content.WriteString(typeStyle.Render(typeStr))
 		content.WriteString(" ")
-		content.WriteString(nameStyle.Render(nameStr))
+		content.WriteString(rowNameStyle.Render(nameStr))
 		content.WriteString("\n")
 	}
 
@@ -435,10 +452,9 @@ func (m *ActivityList) syncActivities() tea.Msg {
 	// Update total count for status display
 	m.totalGarminActivities = len(activities)
 
-	for _, activity := range activities {
-		if err := m.storage.Save(activity); err != nil {
-			return syncErrorMsg{err}
-		}
+	// Bulk write path: one directory sync instead of an fsync per activity
+	if err := m.storage.SaveAll(activities); err != nil {
+		return syncErrorMsg{err}
 	}
 	return syncCompleteMsg{count: len(activities)}
 }
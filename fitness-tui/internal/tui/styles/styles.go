@@ -33,6 +33,16 @@ type Styles struct {
 	TwoColumnLayout func(string, string, int) string
 }
 
+// defaultStyles is built once at startup; nothing mutates a Styles after
+// construction, so screens share this compiled set rather than rebuilding
+// every color, panel and closure on each screen entry.
+var defaultStyles = NewStyles()
+
+// DefaultStyles returns the shared style sheet used by all screens.
+func DefaultStyles() *Styles {
+	return defaultStyles
+}
+
 func NewStyles() *Styles {
 	s := &Styles{}
 